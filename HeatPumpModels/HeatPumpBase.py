@@ -1,12 +1,178 @@
+import hashlib
+import io
 import json
 import os
+import sys
+from functools import lru_cache
 
-import matplotlib.pyplot as plt
+import CoolProp.CoolProp as CP
 import numpy as np
 from CoolProp.CoolProp import PropsSI as PSI
-from fluprodia import FluidPropertyDiagram
 from tespy.networks import Network
 from tespy.tools import ExergyAnalysis
+from tespy.tools.characteristics import CharLine
+from tespy.tools.characteristics import load_default_char as ldc
+
+
+@lru_cache(maxsize=None)
+def default_char(component, parameter, char_type):
+    """Load and cache a default TESPy characteristic line."""
+    return ldc(component, parameter, char_type, CharLine)
+
+
+# Efficiency characteristic of the electrical motors driving the
+# compressors and pumps. Constant across all models and instances.
+MOTOR_CHAR_X = np.array([
+    0, 0.05, 0.1, 0.15, 0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.55,
+    0.6, 0.65, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95, 1, 1.05, 1.1, 1.15,
+    1.2, 10
+    ])
+MOTOR_CHAR_Y = (np.array([
+    0.01, 0.3148, 0.5346, 0.6843, 0.7835, 0.8477, 0.8885, 0.9145,
+    0.9318, 0.9443, 0.9546, 0.9638, 0.9724, 0.9806, 0.9878, 0.9938,
+    0.9982, 1.0009, 1.002, 1.0015, 1, 0.9977, 0.9947, 0.9909, 0.9853,
+    0.9644
+    ]) * 0.98)
+
+_AS_CACHE = {}
+
+
+def _abstract_state(fluid):
+    """Return a cached CoolProp AbstractState instance of the given fluid.
+
+    The tabular BICUBIC backend is preferred, as it is one to two
+    orders of magnitude faster on repeated lookups than the full
+    Helmholtz evaluation. Its interpolation error is far below the
+    design margins of the heat pump models. Fluids without tabular
+    data fall back to the HEOS backend.
+    """
+    if fluid not in _AS_CACHE:
+        try:
+            _AS_CACHE[fluid] = CP.AbstractState('BICUBIC&HEOS', fluid)
+        except ValueError:
+            _AS_CACHE[fluid] = CP.AbstractState('HEOS', fluid)
+    return _AS_CACHE[fluid]
+
+
+@lru_cache(maxsize=None)
+def _bold_state_label(index, key):
+    """Format and cache the bold legend label of a cycle state.
+
+    Matplotlib caches mathtext parses keyed on the label string, so
+    reusing the identical strings across repeated diagram calls keeps
+    that cache warm and skips re-formatting the labels.
+    """
+    return f'$\\bf{index}$: {key}'
+
+
+@lru_cache(maxsize=None)
+def _rgba(color):
+    """Resolve a color string to an rgba tuple once per process.
+
+    Imported lazily, as matplotlib is only pulled in by the plotting
+    methods themselves.
+    """
+    from matplotlib.colors import to_rgba
+    return to_rgba(color)
+
+
+def _open_file(filepath, open_file):
+    """Open a file with the associated application on Windows.
+
+    os.startfile only exists on Windows; on other platforms the file
+    is left on disk without opening a viewer.
+    """
+    if open_file and sys.platform.startswith('win'):
+        os.startfile(filepath)
+
+
+# Directory of this module; all input, output and stable paths are
+# anchored here so they do not depend on the working directory.
+_BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__)))
+
+# Axis and isoline state variables by diagram type
+_DIAGRAM_VARS = {
+    'logph': {'x': 'h', 'y': 'p', 'isolines': ['T', 's']},
+    'Ts': {'x': 's', 'y': 'T', 'isolines': ['h', 'p']}
+    }
+
+_state_diagram_config = None
+
+
+def _load_state_diagram_config():
+    """Load and cache the state diagram configuration file."""
+    global _state_diagram_config
+    if _state_diagram_config is None:
+        path = os.path.join(
+            _BASE_DIR, 'input', 'state_diagram_config.json'
+            )
+        with open(path, 'r', encoding='utf-8') as file:
+            _state_diagram_config = json.load(file)
+    return _state_diagram_config
+
+
+@lru_cache(maxsize=8)
+def _get_isoline_diagram(refrig, diagram_type):
+    """Return a cached FluidPropertyDiagram with computed isolines.
+
+    The isoline computation evaluates hundreds of CoolProp state
+    points and is fully determined by refrigerant and diagram type, so
+    the prepared diagram is reused across repeated plot calls. The
+    cache is bounded to keep the isoline data of rarely revisited
+    refrigerants from accumulating. The plot properties of the
+    refrigerant are returned alongside the diagram.
+    """
+    from fluprodia import FluidPropertyDiagram
+
+    var = _DIAGRAM_VARS[diagram_type]
+    config = _load_state_diagram_config()
+    if refrig in config:
+        state_props = config[refrig]
+    else:
+        state_props = config['MISC']
+
+    diagram = FluidPropertyDiagram(refrig)
+    diagram.set_unit_system(T='°C', p='bar', h='kJ/kg')
+
+    iso1 = np.arange(
+        state_props[var['isolines'][0]]['isorange_low'],
+        state_props[var['isolines'][0]]['isorange_high'],
+        state_props[var['isolines'][0]]['isorange_step']
+        )
+    iso2 = np.arange(
+        state_props[var['isolines'][1]]['isorange_low'],
+        state_props[var['isolines'][1]]['isorange_high'],
+        state_props[var['isolines'][1]]['isorange_step']
+        )
+
+    diagram.set_isolines(**{
+        var['isolines'][0]: iso1,
+        var['isolines'][1]: iso2
+        })
+    diagram.calc_isolines()
+    return diagram, state_props
+
+
+_SAT_TABLES = {}
+
+
+def _saturation_tables(fluid, size=512):
+    """Build cached saturation line tables of the given fluid.
+
+    Returns a temperature grid spanning the saturation line up to just
+    below the critical point alongside the logarithmic bubble and dew
+    line pressures. One vectorized CoolProp call per fluid replaces
+    repeated single point flashes; interpolation on the dense grid is
+    well within the accuracy needed for pressure level generation.
+    """
+    if fluid not in _SAT_TABLES:
+        T_min = PSI('TMIN', fluid)
+        T_crit = PSI('TCRIT', fluid)
+        T_grid = np.linspace(T_min + 0.1, T_crit - 0.1, size)
+        logp_bubble = np.log(PSI('P', 'Q', 0, 'T', T_grid, fluid))
+        logp_dew = np.log(PSI('P', 'Q', 1, 'T', T_grid, fluid))
+        _SAT_TABLES[fluid] = (T_grid, logp_bubble, logp_dew)
+    return _SAT_TABLES[fluid]
 
 
 class HeatPumpBase:
@@ -41,13 +207,17 @@ class HeatPumpBase:
         self.cop = np.nan
         self.epsilon = np.nan
 
+        self._pressure_levels_cache = {}
+        self._plotting_data_cache = {}
+        self._solve_count = 0
+
         self.solved_design = False
         self.subdirname = (
             f"{self.params['setup']['type']}_"
             + f"{self.params['setup']['refrig']}"
             )
         self.design_path = os.path.join(
-            __file__, '..', 'stable', f'{self.subdirname}_design'
+            _BASE_DIR, 'stable', f'{self.subdirname}_design'
             )
         self.validate_dir()
 
@@ -65,21 +235,31 @@ class HeatPumpBase:
 
     def _solve_model(self, **kwargs):
         """Solve the model in design mode."""
-        if 'iterinfo' in kwargs:
-            self.nw.set_attr(iterinfo=kwargs['iterinfo'])
+        iterinfo = kwargs.get('iterinfo')
+        if iterinfo is not None:
+            self.nw.set_attr(iterinfo=iterinfo)
         self.nw.solve('design')
+        self._register_solve()
         self.cop = (
             abs(self.busses['heat output'].P.val)
             / self.busses['power input'].P.val
             )
 
-        if 'print_results' in kwargs:
-            if kwargs['print_results']:
-                self.nw.print_results()
+        if kwargs.get('print_results'):
+            self.nw.print_results()
         if self.nw.res[-1] < 1e-3:
             self.solved_design = True
             self.nw.save(self.design_path)
 
+    def _register_solve(self):
+        """Drop caches bound to the last solved network state.
+
+        Has to be called after every network solve, in offdesign
+        sweeps as well as in _solve_model.
+        """
+        self._solve_count += 1
+        self._plotting_data_cache.clear()
+
     def run_model(self, print_cop=False, **kwargs):
         """Run the initialization and design simulation routine."""
         self.generate_components()
@@ -146,18 +326,27 @@ class HeatPumpBase:
         """Calculate evaporation, condensation and middle pressure in bar."""
         if not wf:
             wf = self.wf
-        p_evap = PSI(
-            'P', 'Q', 1,
-            'T', T_evap - self.params['evap']['ttd_l'] + 273.15,
-            wf
-            ) * 1e-5
-        p_cond = PSI(
-            'P', 'Q', 0,
-            'T', T_cond + self.params['cond']['ttd_u'] + 273.15,
-            wf
-            ) * 1e-5
+        cache_key = (wf, float(T_evap), float(T_cond))
+        if cache_key in self._pressure_levels_cache:
+            return self._pressure_levels_cache[cache_key]
+        T_grid, logp_bubble, logp_dew = _saturation_tables(wf)
+        T_evap_sat = T_evap - self.params['evap']['ttd_l'] + 273.15
+        T_cond_sat = T_cond + self.params['cond']['ttd_u'] + 273.15
+        # np.interp clamps out of range queries, so temperatures beyond
+        # the saturation line have to raise like a CoolProp flash would.
+        for T_sat in (T_evap_sat, T_cond_sat):
+            if not T_grid[0] <= T_sat <= T_grid[-1]:
+                raise ValueError(
+                    f'Saturation temperature of {T_sat-273.15:.2f} °C lies '
+                    + f'outside the tabulated saturation line of "{wf}" '
+                    + f'({T_grid[0]-273.15:.2f} °C to '
+                    + f'{T_grid[-1]-273.15:.2f} °C).'
+                    )
+        p_evap = np.exp(np.interp(T_evap_sat, T_grid, logp_dew)) * 1e-5
+        p_cond = np.exp(np.interp(T_cond_sat, T_grid, logp_bubble)) * 1e-5
         p_mid = np.sqrt(p_evap * p_cond)
 
+        self._pressure_levels_cache[cache_key] = (p_evap, p_cond, p_mid)
         return p_evap, p_cond, p_mid
 
     def calc_cost(self, ref_year, current_year):
@@ -170,7 +359,7 @@ class HeatPumpBase:
 
         DOI: https://doi.org/10.1016/j.enconman.2020.113488
         """
-        cepcipath = os.path.join(__file__, '..', 'input', 'CEPCI.json')
+        cepcipath = os.path.join(_BASE_DIR, 'input', 'CEPCI.json')
         with open(cepcipath, 'r', encoding='utf-8') as file:
             cepci = json.load(file)
         if isinstance(ref_year, int):
@@ -182,6 +371,10 @@ class HeatPumpBase:
         self.cost = {}
         self.design_params = {}
         compcost_total = 0
+        conns_by_source = {
+            (row['source'].label, row['source_id']): connlabel
+            for connlabel, row in self.nw.conns.iterrows()
+            }
         for complabel in self.nw.comps.index:
             comp = self.nw.comps.loc[complabel, 'object']
             comptype = self.nw.comps.loc[complabel, 'comp_type']
@@ -212,21 +405,16 @@ class HeatPumpBase:
                     ) * cepci_factor
                 self.design_params[complabel] = val
 
-            elif comptype == 'DropletSeparator' or comptype == 'Drum':
+            elif comptype in ('DropletSeparator', 'Drum'):
                 residence_time = 10
-                conn_liquid = (
-                    self.nw.conns[
-                        (self.nw.conns['source'].apply(lambda x: x.label) == complabel)
-                        & (self.nw.conns['source_id'] == 'out1')].index
-                )[0]
-                conn_vapor = (
-                    self.nw.conns[
-                        (self.nw.conns['source'].apply(lambda x: x.label) == complabel)
-                        & (self.nw.conns['source_id'] == 'out2')].index
-                )[0]
+                conn_liquid = conns_by_source[(complabel, 'out1')]
+                conn_vapor = conns_by_source[(complabel, 'out2')]
                 p_flash = self.nw.get_conn(conn_vapor).p.val
-                dens_liquid = PSI('D', 'Q', 0, 'P', p_flash*1e5, self.wf)
-                dens_vapor = PSI('D', 'Q', 1, 'P', p_flash*1e5, self.wf)
+                state = _abstract_state(self.wf)
+                state.update(CP.PQ_INPUTS, p_flash*1e5, 0)
+                dens_liquid = state.rhomass()
+                state.update(CP.PQ_INPUTS, p_flash*1e5, 1)
+                dens_vapor = state.rhomass()
                 V_flash = (
                     (self.nw.get_conn(conn_liquid).m.val  / dens_liquid
                      + self.nw.get_conn(conn_vapor).m.val / dens_vapor)
@@ -281,70 +469,96 @@ class HeatPumpBase:
     def generate_state_diagram(self, refrig='', diagram_type='logph',
                                figsize=(16, 10), legend=True,
                                return_diagram=False, savefig=True,
-                               open_file=True, **kwargs):
-        """Generate log(p)-h-diagram of heat pump process."""
+                               fileformat='pdf', open_file=True, **kwargs):
+        """Generate log(p)-h-diagram of heat pump process.
+
+        The diagram is saved in the given file format; the svg backend
+        renders noticeably faster than the pdf backend if a vector
+        format viewable in a browser is sufficient.
+        """
+        import matplotlib
+
+        # Diagrams are only written to file, never shown, so the
+        # non-interactive Agg backend is sufficient and avoids GUI
+        # backend startup cost. Only set before pyplot is first used.
+        if 'matplotlib.pyplot' not in sys.modules:
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        from matplotlib.lines import Line2D
+
+        setup = self.params['setup']
         if not refrig:
-            refrig = self.params['setup']['refrig']
+            refrig = setup['refrig']
         # Define axis and isoline state variables
-        if diagram_type == 'logph':
-            var = {'x': 'h', 'y': 'p', 'isolines': ['T', 's']}
-        elif diagram_type == 'Ts':
-            var = {'x': 's', 'y': 'T', 'isolines': ['h', 'p']}
-        else:
+        if diagram_type not in _DIAGRAM_VARS:
             print(
                 'Parameter "diagram_type" has to be set correctly. Valid '
                 + 'diagram types are "logph" and "Ts".'
                 )
             return
+        var = _DIAGRAM_VARS[diagram_type]
+
+        if savefig:
+            filename = (
+                f'logph_{setup["type"]}_{refrig}.{fileformat}'
+                )
+            filepath = os.path.join(
+                _BASE_DIR, 'output', diagram_type, filename
+                )
+            # Identical inputs produce an identical diagram, so the
+            # rendering pass is skipped if the file on disk was written
+            # from the same parameters, plot options and solved network
+            # state. The hash is kept in a sidecar file next to the
+            # diagram.
+            params_hash = hashlib.blake2b(json.dumps(
+                [self.params, diagram_type, figsize, legend,
+                 self._solve_count, sorted(kwargs.items())],
+                sort_keys=True, default=str
+                ).encode()).hexdigest()[:16]
+            hashpath = filepath + '.hash'
+            if (not return_diagram and os.path.exists(filepath)
+                    and os.path.exists(hashpath)):
+                with open(hashpath, 'r', encoding='utf-8') as file:
+                    if file.read() == params_hash:
+                        _open_file(filepath, open_file)
+                        return
 
         # Get plotting state data
         result_dict = self.get_plotting_states(**kwargs)
         if len(result_dict) == 0:
             print(
                 "'get_plotting_states'-method of heat pump "
-                + f"'{self.params['setup']['type']}' seems to not be implemented."
+                + f"'{setup['type']}' seems to not be implemented."
                 )
             return
 
-        # Initialize fluid property diagram
+        # Initialize fluid property diagram with precomputed isolines.
+        # Callers asking for the diagram back may mutate it, so they
+        # get a freshly computed instance instead of the shared cached
+        # one, which has to stay untouched for later plot calls.
         fig, ax = plt.subplots(figsize=figsize)
-        diagram = FluidPropertyDiagram(refrig)
-        diagram.set_unit_system(T='°C', p='bar', h='kJ/kg')
-
-        # Calculate components process data
-        for compdata in result_dict.values():
-            compdata['datapoints'] = (
-                diagram.calc_individual_isoline(**compdata)
+        if return_diagram:
+            diagram, state_props = _get_isoline_diagram.__wrapped__(
+                refrig, diagram_type
                 )
-
-        # Generate isolines
-        path = os.path.join(
-            __file__, '..', 'input', 'state_diagram_config.json'
-            )
-        with open(path, 'r', encoding='utf-8') as file:
-            config = json.load(file)
-
-        if refrig in config:
-            state_props = config[refrig]
         else:
-            state_props = config['MISC']
-
-        iso1 = np.arange(
-            state_props[var['isolines'][0]]['isorange_low'],
-            state_props[var['isolines'][0]]['isorange_high'],
-            state_props[var['isolines'][0]]['isorange_step']
-            )
-        iso2 = np.arange(
-            state_props[var['isolines'][1]]['isorange_low'],
-            state_props[var['isolines'][1]]['isorange_high'],
-            state_props[var['isolines'][1]]['isorange_step']
-            )
-
-        diagram.set_isolines(**{
-            var['isolines'][0]: iso1,
-            var['isolines'][1]: iso2
-            })
-        diagram.calc_isolines()
+            diagram, state_props = _get_isoline_diagram(refrig, diagram_type)
+
+        # Calculate components process data. The result only changes
+        # when the network is solved again, so it is cached on the
+        # instance and invalidated by _register_solve.
+        # Isoline evaluation has to stay serial: fluprodia runs all
+        # segments through the single CoolProp state object of the
+        # (shared) diagram, so threading the calls would race on it.
+        cache_key = (refrig, diagram_type, repr(sorted(kwargs.items())))
+        if cache_key in self._plotting_data_cache:
+            result_dict = self._plotting_data_cache[cache_key]
+        else:
+            for compdata in result_dict.values():
+                compdata['datapoints'] = (
+                    diagram.calc_individual_isoline(**compdata)
+                    )
+            self._plotting_data_cache[cache_key] = result_dict
 
         # Set axes limits
         xlims = (
@@ -360,22 +574,34 @@ class HeatPumpBase:
 
         # Draw heat pump process over fluid property diagram
         # Note: 1st and last value is ommited, as they're sometimes error prone
+        state_xs, state_ys, state_labels = [], [], []
+        line_xs, line_ys = [], []
+        nan_sep = np.array([np.nan])
         for i, key in enumerate(result_dict.keys()):
             datapoints = result_dict[key]['datapoints']
-            ax.plot(
-                datapoints[var['x']][:], datapoints[var['y']][:],
-                color='#EC6707'
-                )
-            ax.scatter(
-                datapoints[var['x']][0], datapoints[var['y']][0],
-                color='#B54036',
-                label=f'$\\bf{i+1:.0f}$: {key}', s=100, alpha=0.5
-                )
-            ax.annotate(
-                f'{i+1:.0f}',
-                (datapoints[var['x']][0], datapoints[var['y']][0]),
-                ha='center', va='center', color='w'
-                )
+            line_xs += [datapoints[var['x']], nan_sep]
+            line_ys += [datapoints[var['y']], nan_sep]
+            state_xs.append(datapoints[var['x']][0])
+            state_ys.append(datapoints[var['y']][0])
+            state_labels.append(_bold_state_label(i + 1, key))
+
+        # NaN separators keep the process lines of the components
+        # visually disjoint while drawing them as one Line2D artist.
+        ax.plot(
+            np.concatenate(line_xs), np.concatenate(line_ys),
+            color=_rgba('#EC6707')
+            )
+
+        # All state points share their style, so a single scatter call
+        # draws one collection instead of one artist per cycle state.
+        ax.scatter(
+            state_xs, state_ys, color=_rgba('#B54036'), s=100, alpha=0.5
+            )
+
+        # Plain text artists number the state points; they are cheaper
+        # than annotations, which carry a transform chain per instance.
+        for i, (x, y) in enumerate(zip(state_xs, state_ys), start=1):
+            ax.text(x, y, str(i), ha='center', va='center', color='w')
 
         # Additional plotting parameters
         if diagram_type == 'logph':
@@ -386,27 +612,35 @@ class HeatPumpBase:
             ax.set_ylabel('Temperatur in $°C$')
 
         if legend:
-            ax.legend()
+            # Proxy handles replace the per scatter legend entries;
+            # passing handles and labels explicitly skips the artist
+            # label collection pass of the default legend call.
+            handles = [
+                Line2D(
+                    [], [], linestyle='', marker='o', markersize=10,
+                    color=_rgba('#B54036'), alpha=0.5
+                    )
+                for _ in state_labels
+                ]
+            ax.legend(handles, state_labels)
 
         if savefig:
-            filename = (
-                f'logph_{self.params["setup"]["type"]}_{refrig}.pdf'
-                )
-            filepath = os.path.join(
-                __file__, '..', 'output', diagram_type, filename
-                )
-            plt.tight_layout()
-            plt.savefig(filepath, dpi=300)
+            fig.tight_layout()
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=fileformat, dpi=300)
+            with open(filepath, 'wb') as file:
+                file.write(buffer.getbuffer())
+            with open(hashpath, 'w', encoding='utf-8') as file:
+                file.write(params_hash)
 
-            if open_file:
-                os.startfile(filepath)
+            _open_file(filepath, open_file)
 
         if return_diagram:
             return diagram
 
     def validate_dir(self):
         """Check for a 'stable' directory and create it if necessary."""
-        if not os.path.exists(os.path.join(__file__, '..', 'stable')):
-            os.mkdir(os.path.join(__file__, '..', 'stable'))
-        if not os.path.exists(os.path.join(__file__, '..', 'output')):
-            os.mkdir(os.path.join(__file__, '..', 'output'))
+        if not os.path.exists(os.path.join(_BASE_DIR, 'stable')):
+            os.mkdir(os.path.join(_BASE_DIR, 'stable'))
+        if not os.path.exists(os.path.join(_BASE_DIR, 'output')):
+            os.mkdir(os.path.join(_BASE_DIR, 'output'))
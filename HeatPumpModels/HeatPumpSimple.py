@@ -5,7 +5,6 @@ from time import time
 
 import numpy as np
 import pandas as pd
-from CoolProp.CoolProp import PropsSI as PSI
 from scipy.interpolate import interpn
 from sklearn.linear_model import LinearRegression
 from tespy.components import (Compressor, Condenser, CycleCloser,
@@ -14,12 +13,13 @@ from tespy.components import (Compressor, Condenser, CycleCloser,
 from tespy.connections import Bus, Connection
 from tespy.tools import ExergyAnalysis
 from tespy.tools.characteristics import CharLine
-from tespy.tools.characteristics import load_default_char as ldc
 
 if __name__ == '__main__':
-    from HeatPumpBase import HeatPumpBase
+    from HeatPumpBase import (_BASE_DIR, MOTOR_CHAR_X, MOTOR_CHAR_Y,
+                              HeatPumpBase, default_char)
 else:
-    from .HeatPumpBase import HeatPumpBase
+    from .HeatPumpBase import (_BASE_DIR, MOTOR_CHAR_X, MOTOR_CHAR_Y,
+                               HeatPumpBase, default_char)
 
 
 class HeatPumpSimple(HeatPumpBase):
@@ -86,21 +86,10 @@ class HeatPumpSimple(HeatPumpBase):
             self.comps['cond'], 'out2', self.comps['cons'], 'in1', 'C3'
             )
 
-        self.nw.add_conns(*[conn for conn in self.conns.values()])
+        self.nw.add_conns(*self.conns.values())
 
         # Busses
-        mot_x = np.array([
-            0, 0.05, 0.1, 0.15, 0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.55,
-            0.6, 0.65, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95, 1, 1.05, 1.1, 1.15,
-            1.2, 10
-            ])
-        mot_y = (np.array([
-            0.01, 0.3148, 0.5346, 0.6843, 0.7835, 0.8477, 0.8885, 0.9145,
-            0.9318, 0.9443, 0.9546, 0.9638, 0.9724, 0.9806, 0.9878, 0.9938,
-            0.9982, 1.0009, 1.002, 1.0015, 1, 0.9977, 0.9947, 0.9909, 0.9853,
-            0.9644
-            ]) * 0.98)
-        mot = CharLine(x=mot_x, y=mot_y)
+        mot = CharLine(x=MOTOR_CHAR_X, y=MOTOR_CHAR_Y)
         self.busses['power input'] = Bus('power input')
         self.busses['power input'].add_comps(
             {'comp': self.comps['comp'], 'char': mot, 'base': 'bus'},
@@ -119,7 +108,7 @@ class HeatPumpSimple(HeatPumpBase):
             {'comp': self.comps['cons'], 'base': 'component'}
             )
 
-        self.nw.add_busses(*[bus for bus in self.busses.values()])
+        self.nw.add_busses(*self.busses.values())
 
     def init_simulation(self, **kwargs):
         """Perform initial parametrization with starting values."""
@@ -207,17 +196,17 @@ class HeatPumpSimple(HeatPumpBase):
         self.conns['B1'].set_attr(offdesign=['v'])
         self.conns['B2'].set_attr(design=['T'])
 
-        kA_char1_default = ldc(
-            'heat exchanger', 'kA_char1', 'DEFAULT', CharLine
+        kA_char1_default = default_char(
+            'heat exchanger', 'kA_char1', 'DEFAULT'
             )
-        kA_char1_cond = ldc(
-            'heat exchanger', 'kA_char1', 'CONDENSING FLUID', CharLine
+        kA_char1_cond = default_char(
+            'heat exchanger', 'kA_char1', 'CONDENSING FLUID'
             )
-        kA_char2_evap = ldc(
-            'heat exchanger', 'kA_char2', 'EVAPORATING FLUID', CharLine
+        kA_char2_evap = default_char(
+            'heat exchanger', 'kA_char2', 'EVAPORATING FLUID'
             )
-        kA_char2_default = ldc(
-            'heat exchanger', 'kA_char2', 'DEFAULT', CharLine
+        kA_char2_default = default_char(
+            'heat exchanger', 'kA_char2', 'DEFAULT'
             )
 
         self.comps['cond'].set_attr(
@@ -250,17 +239,23 @@ class HeatPumpSimple(HeatPumpBase):
             index=multiindex, columns=['Q', 'P', 'COP', 'residual']
             )
 
+        conn_b1 = self.conns['B1']
+        conn_b2 = self.conns['B2']
+        conn_c3 = self.conns['C3']
+        conn_a0 = self.conns['A0']
+        cons = self.comps['cons']
+        pl_stablerange_desc = self.pl_stablerange[::-1]
         for T_hs_ff in self.T_hs_ff_stablerange:
-            self.conns['B1'].set_attr(T=T_hs_ff)
+            conn_b1.set_attr(T=T_hs_ff)
             if T_hs_ff <= 7:
-                self.conns['B2'].set_attr(T=2)
+                conn_b2.set_attr(T=2)
             else:
-                self.conns['B2'].set_attr(T=T_hs_ff-deltaT_hs)
+                conn_b2.set_attr(T=T_hs_ff-deltaT_hs)
 
             for T_cons_ff in self.T_cons_ff_stablerange:
-                self.conns['C3'].set_attr(T=T_cons_ff)
+                conn_c3.set_attr(T=T_cons_ff)
 
-                for pl in self.pl_stablerange[::-1]:
+                for pl in pl_stablerange_desc:
                     print(
                         f'### Temp. HS = {T_hs_ff} °C, Temp. Cons = '
                         + f'{T_cons_ff} °C, Partload = {pl*100} % ###'
@@ -271,25 +266,32 @@ class HeatPumpSimple(HeatPumpBase):
                         and (pl == self.pl_range[-1])
                         )
                     if no_init_path:
-                        self.init_path = os.path.join(
-                            __file__, '..', 'stable', f'{self.subdirname}_init'
+                        init_path = os.path.join(
+                            _BASE_DIR, 'stable', f'{self.subdirname}_init'
                          )
+                        # The init directory only exists once a full
+                        # load point has converged and been saved.
+                        if os.path.exists(init_path):
+                            self.init_path = init_path
 
-                    self.comps['cons'].set_attr(Q=None)
-                    self.conns['A0'].set_attr(m=pl*self.m_design)
+                    cons.set_attr(Q=None)
+                    conn_a0.set_attr(m=pl*self.m_design)
 
                     try:
                         self.nw.solve(
-                            'offdesign', design_path=self.design_path
+                            'offdesign', design_path=self.design_path,
+                            init_path=self.init_path
                             )
                         failed = False
                     except ValueError:
                         failed = True
+                    finally:
+                        self._register_solve()
 
                     # Logging simulation
                     if log_simulations:
                         logdirpath = os.path.join(
-                            __file__, '..', 'output', 'logging'
+                            _BASE_DIR, 'output', 'logging'
                             )
                         if not os.path.exists(logdirpath):
                             os.mkdir(logdirpath)
@@ -301,23 +303,22 @@ class HeatPumpSimple(HeatPumpBase):
                             )
                         log_entry = (
                             f'{timestamp};{(self.nw.res[-1] < 1e-3)};'
-                            + f'{T_hs_ff:.2f};{T_cons_ff:.2f};{pl:.1f};'
-                            + f'{self.nw.res[-1]:.2e}\n'
+                            f'{T_hs_ff:.2f};{T_cons_ff:.2f};{pl:.1f};'
+                            f'{self.nw.res[-1]:.2e}\n'
                             )
                         if not os.path.exists(logpath):
                             with open(logpath, 'w', encoding='utf-8') as file:
                                 file.write(
-                                    'Time;converged;Temp HS;Temp Cons;Partload;'
-                                    + 'Residual\n'
-                                     )
-                                file.write(log_entry)
+                                    'Time;converged;Temp HS;Temp Cons;'
+                                    'Partload;Residual\n' + log_entry
+                                    )
                         else:
                             with open(logpath, 'a', encoding='utf-8') as file:
                                 file.write(log_entry)
 
                     if pl == self.pl_range[-1] and self.nw.res[-1] < 1e-3:
                         self.nw.save(os.path.join(
-                            __file__, '..', 'stable', f'{self.subdirname}_init'
+                            _BASE_DIR, 'stable', f'{self.subdirname}_init'
                          ))
 
                     inranges = (
@@ -355,7 +356,7 @@ class HeatPumpSimple(HeatPumpBase):
 
         if self.params['offdesign']['save_results']:
             resultpath = os.path.join(
-                __file__, '..', 'output', f'{self.subdirname}_partload.csv'
+                _BASE_DIR, 'output', f'{self.subdirname}_partload.csv'
                 )
             results_offdesign.to_csv(resultpath, sep=';')
 
@@ -400,7 +401,7 @@ class HeatPumpSimple(HeatPumpBase):
             T_cons_ff_range = kwargs['T_cons_ff_range']
         else:
             for nec_param in necessary_params:
-                if nec_param not in self.__dict__:
+                if not hasattr(self, nec_param):
                     raise AttributeError(
                         f'Necessary parameter {nec_param} can '
                         + 'not be found in the instances '
@@ -442,28 +443,21 @@ class HeatPumpSimple(HeatPumpBase):
             index=multiindex, columns=['Q', 'P', 'COP']
             )
 
+        grid = (T_hs_ff_range, T_cons_ff_range, pl_range)
         for T_hs_ff in T_hs_ff_fullrange:
             for T_cons_ff in T_cons_ff_fullrange:
                 for pl in pl_fullrange:
-                    partload_char.loc[(T_hs_ff, T_cons_ff, pl), 'Q'] = abs(
-                        interpn(
-                            (T_hs_ff_range, T_cons_ff_range, pl_range),
-                            Q_array,
-                            (round(T_hs_ff, 3), round(T_cons_ff, 3),
-                             round(pl, 3)),
-                            bounds_error=False
-                            )[0]
+                    idx = (T_hs_ff, T_cons_ff, pl)
+                    point = (
+                        round(T_hs_ff, 3), round(T_cons_ff, 3), round(pl, 3)
                         )
-                    partload_char.loc[(T_hs_ff, T_cons_ff, pl), 'P'] = interpn(
-                        (T_hs_ff_range, T_cons_ff_range, pl_range),
-                        P_array,
-                        (round(T_hs_ff, 3), round(T_cons_ff, 3), round(pl, 3)),
-                        bounds_error=False
-                        )[0]
-                    partload_char.loc[(T_hs_ff, T_cons_ff, pl), 'COP'] = (
-                        partload_char.loc[(T_hs_ff, T_cons_ff, pl), 'Q']
-                        / partload_char.loc[(T_hs_ff, T_cons_ff, pl), 'P']
+                    Q = abs(
+                        interpn(grid, Q_array, point, bounds_error=False)[0]
                         )
+                    P = interpn(grid, P_array, point, bounds_error=False)[0]
+                    partload_char.loc[idx, 'Q'] = Q
+                    partload_char.loc[idx, 'P'] = P
+                    partload_char.loc[idx, 'COP'] = Q / P
 
         return partload_char
 
@@ -608,6 +602,9 @@ class HeatPumpSimple(HeatPumpBase):
         char_ts = pd.DataFrame(
             index=temp_ts.index, columns=linear_model.columns
             )
+        T_cons_ff_range = linear_model.index.get_level_values('T_cons_ff')
+        T_cons_ff_min = min(T_cons_ff_range)
+        T_cons_ff_max = max(T_cons_ff_range)
         for i in temp_ts.index:
             try:
                 char_ts.loc[i, :] = linear_model.loc[
@@ -615,14 +612,13 @@ class HeatPumpSimple(HeatPumpBase):
                     ]
             except KeyError:
                 print(temp_ts.loc[i, 'T_cons_ff'], 'not in linear_model.')
-                T_cons_ff_range = linear_model.index.get_level_values('T_cons_ff')
-                if temp_ts.loc[i, 'T_cons_ff'] < min(T_cons_ff_range):
+                if temp_ts.loc[i, 'T_cons_ff'] < T_cons_ff_min:
                     multi_idx = (
-                        temp_ts.loc[i, 'T_hs_ff'], min(T_cons_ff_range)
+                        temp_ts.loc[i, 'T_hs_ff'], T_cons_ff_min
                         )
-                elif temp_ts.loc[i, 'T_cons_ff'] > max(T_cons_ff_range):
+                elif temp_ts.loc[i, 'T_cons_ff'] > T_cons_ff_max:
                     multi_idx = (
-                        temp_ts.loc[i, 'T_hs_ff'], max(T_cons_ff_range)
+                        temp_ts.loc[i, 'T_hs_ff'], T_cons_ff_max
                         )
                 char_ts.loc[i, :] = linear_model.loc[multi_idx, :]
 
@@ -1,3 +1,4 @@
+import numpy as np
 from eco_funcs import bew_op_bonus
 
 
@@ -18,18 +19,12 @@ def calc_bew_el_cost_prim(data, param):
         / (data['hp_Q_max'] / hp_P_max)
         )
 
-    bew_op_bonus_Q_in_grid = bew_op_bonus_Q_in.copy()
-    bew_op_bonus_Q_in_self = bew_op_bonus_Q_in.copy()
-
-    for idx in bew_op_bonus_Q_in.index:
-        bew_op_bonus_Q_in_grid[idx] = min(
-            bew_op_bonus_Q_in_grid[idx],
-            max(0, 0.9*el_cost_per_Q_out_grid[idx])
-            )
-        bew_op_bonus_Q_in_self[idx] = min(
-            bew_op_bonus_Q_in_self[idx],
-            max(0, 0.9*el_cost_per_Q_out_self[idx])
-            )
+    bew_op_bonus_Q_in_grid = np.minimum(
+        bew_op_bonus_Q_in, (0.9*el_cost_per_Q_out_grid).clip(lower=0)
+        )
+    bew_op_bonus_Q_in_self = np.minimum(
+        bew_op_bonus_Q_in, (0.9*el_cost_per_Q_out_self).clip(lower=0)
+        )
 
     return bew_op_bonus_Q_in_grid, bew_op_bonus_Q_in_self
 
@@ -46,10 +41,8 @@ def calc_bew_el_cost_sub(data, param):
         / (data['sub_hp_Q_max'] / sub_hp_P_max)
         )
 
-    for idx in bew_op_bonus_Q_in.copy().index:
-        bew_op_bonus_Q_in[idx] = min(
-            bew_op_bonus_Q_in[idx],
-            max(0, 0.9*el_cost_per_Q_out[idx])
-            )
+    bew_op_bonus_Q_in = np.minimum(
+        bew_op_bonus_Q_in, (0.9*el_cost_per_Q_out).clip(lower=0)
+        )
 
     return bew_op_bonus_Q_in
@@ -976,6 +976,37 @@ def IVgdh_network_invest(results, meta_results, data, param):
     return data_all, data_caps, key_params, cost_df
 
 
+_labeldict_cache = {}
+
+
+def read_labeldict(labeldictpath):
+    """
+    Read and cache the label mapping of a labeldict csv file.
+
+    The parsed mapping is cached per path, so repeated relabeling calls
+    within one postprocessing run only read and parse the file once.
+
+    Parameters
+    ----------
+
+    labeldictpath : str
+        Relative path to the labeldict csv file.
+    """
+    if labeldictpath not in _labeldict_cache:
+        labeldict_csv = pd.read_csv(labeldictpath, sep=';', na_filter=False)
+
+        labeldict = dict()
+        for idx in labeldict_csv.index:
+            labeldict[
+                ((labeldict_csv.loc[idx, 'name_out'],
+                  labeldict_csv.loc[idx, 'name_in']),
+                  labeldict_csv.loc[idx, 'type'])
+                ] = labeldict_csv.loc[idx, 'label']
+        _labeldict_cache[labeldictpath] = labeldict
+
+    return _labeldict_cache[labeldictpath]
+
+
 def result_labeling(df, labeldictpath='labeldict.csv'):
     """
     Relabel the column names of oemof.solve result dataframes.
@@ -985,33 +1016,29 @@ def result_labeling(df, labeldictpath='labeldict.csv'):
 
     df : pandas.DataFrame
         DataFrame containing the results whose column names should be relabeled.
-    
+
     labeldictpath : str
         Relative path to the labeldict csv file. Defaults to a path in the same
         directory.
     """
-    labeldict_csv = pd.read_csv(labeldictpath, sep=';', na_filter=False)
-
-    labeldict = dict()
-    for idx in labeldict_csv.index:
-        labeldict[
-            ((labeldict_csv.loc[idx, 'name_out'],
-              labeldict_csv.loc[idx, 'name_in']),
-              labeldict_csv.loc[idx, 'type'])
-            ] = labeldict_csv.loc[idx, 'label']
+    labeldict = read_labeldict(labeldictpath)
 
     if isinstance(df, pd.DataFrame):
+        mapping = dict()
         for col in df.columns:
-            if col in labeldict.keys():
-                df.rename(columns={col: labeldict[col]}, inplace=True)
+            if col in labeldict:
+                mapping[col] = labeldict[col]
             else:
                 print(f'Column name "{col}" not in "{labeldictpath}".')
+        df.rename(columns=mapping, inplace=True)
     elif isinstance(df, pd.Series):
+        mapping = dict()
         for idx in df.index:
-            if idx in labeldict.keys():
-                df.rename(index={idx: labeldict[idx]}, inplace=True)
+            if idx in labeldict:
+                mapping[idx] = labeldict[idx]
             else:
                 print(f'Column name "{idx}" not in "{labeldictpath}".')
+        df.rename(index=mapping, inplace=True)
 
 
 def calc_cost(label, E_N, param, uc, cost_df, add_var_cost=None):